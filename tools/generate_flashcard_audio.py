@@ -15,14 +15,23 @@ Example:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
-import base64
-import wave
+import binascii
+import struct
 import time
 import json
 import os
+import re
+import random
 import sys
+import shutil
+import hashlib
+import threading
+import queue
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from tqdm import tqdm
@@ -38,44 +47,208 @@ if not API_KEY:
     print("Please create a .env file with GEMINI_API_KEY=your_api_key")
     sys.exit(1)
 
-# Global variable to track rate limit delay
-_rate_limit_delay = 0
+# Gemini TTS model and voice
+TTS_MODEL = 'gemini-2.5-flash-preview-tts'
+TTS_VOICE = 'Leda'
+TTS_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{TTS_MODEL}:generateContent?key={API_KEY}"
+
+# Request fields that are identical for every call; only "contents" varies
+_PAYLOAD_TEMPLATE = {
+    "generationConfig": {
+        "responseModalities": ["AUDIO"],
+        "speechConfig": {
+            "voiceConfig": {
+                "prebuiltVoiceConfig": {
+                    "voiceName": TTS_VOICE
+                }
+            }
+        }
+    },
+    "model": TTS_MODEL
+}
+
+# Language-specific prompt wrappers, keyed by the language part of the code
+_PROMPT_TEMPLATES = {
+    'en': 'Say this in US English: "{}"',
+    'es': 'Say this in US Spanish: "{}"',
+}
+
+# Shared cache of generated audio, reused across runs and CSV files
+CACHE_DIR = Path.home() / '.cache' / 'flashcard_tts'
+
+# Monotonic time until which all threads hold off after a 429 response
+_rate_limited_until = 0.0
+_rate_limited_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces requests to a fixed rate per minute.
+
+    Shared by all worker threads so their combined request rate stays under
+    the API quota, instead of each thread discovering the limit via a 429.
+    """
+
+    def __init__(self, rate_per_minute):
+        self.lock = threading.Lock()
+        self.set_rate(rate_per_minute)
+
+    def set_rate(self, rate_per_minute):
+        """
+        Change the allowed request rate.
+
+        Args:
+            rate_per_minute (int): Requests allowed per minute.
+        """
+        with self.lock:
+            self.fill_rate = rate_per_minute / 60.0
+            self.tokens = 1.0
+            self.timestamp = time.monotonic()
+
+    def acquire(self):
+        """
+        Block until a token is available, then consume it.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(1.0, self.tokens + (now - self.timestamp) * self.fill_rate)
+                self.timestamp = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.fill_rate
+            time.sleep(wait)
 
 
-def pcm_to_wav(pcm_data, sample_rate, num_channels=1, sample_width=2):
+# Process-wide limiter for Gemini TTS requests (see --rpm)
+_rate_limiter = TokenBucket(60)
+
+# Caps Gemini TTS requests in flight at once (see configure_concurrency);
+# multi-part phrases fan out into several requests, so the word pool alone
+# can exceed it
+_request_slots = None
+
+# Shared HTTP session so TCP/TLS connections to the TTS endpoint are reused
+# across calls (and across worker threads) instead of re-negotiated per word
+SESSION = requests.Session()
+
+# Pool size of the adapter currently mounted on SESSION
+_session_pool_size = None
+
+
+def configure_session(pool_size):
     """
-    Converts raw PCM audio data into a WAV file format.
+    Mount a keep-alive connection pool on the shared HTTP session.
+
+    The pool is only replaced when its size changes, so warm connections
+    survive across CSV files in batch mode; a replaced adapter is closed to
+    release its sockets.
 
     Args:
-        pcm_data (bytes): The raw PCM audio data (signed 16-bit).
+        pool_size (int): Maximum number of pooled connections per host; should
+            cover every request that can be in flight at once.
+    """
+    global _session_pool_size
+
+    if pool_size == _session_pool_size:
+        return
+
+    previous = SESSION.adapters.get('https://')
+    SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=pool_size, max_retries=0))
+    _session_pool_size = pool_size
+    if previous is not None:
+        previous.close()
+
+
+def configure_concurrency(concurrency):
+    """
+    Size the in-flight request cap and the connection pool for a run.
+
+    Args:
+        concurrency (int): Maximum number of Gemini TTS requests in flight at once.
+    """
+    global _request_slots
+
+    _request_slots = threading.BoundedSemaphore(concurrency)
+
+    # Keep a pooled connection per in-flight request so raising the
+    # concurrency never forces new handshakes
+    configure_session(max(32, concurrency))
+
+
+configure_concurrency(8)
+
+
+def wav_header(data_size, sample_rate, num_channels=1, sample_width=2):
+    """
+    Build the 44-byte RIFF/WAVE header for uncompressed PCM audio.
+
+    Args:
+        data_size (int): Length of the PCM audio data in bytes.
         sample_rate (int): The sample rate of the audio (e.g., 24000).
         num_channels (int): The number of audio channels (e.g., 1 for mono).
         sample_width (int): The width of each audio sample in bytes (e.g., 2 for 16-bit).
 
     Returns:
-        bytes: The in-memory WAV file data.
+        bytes: The WAV header.
     """
-    temp_file = "temp_audio.wav"
-    with wave.open(temp_file, 'wb') as wav_file:
-        wav_file.setnchannels(num_channels)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(pcm_data)
-
-    with open(temp_file, 'rb') as f:
-        wav_file_data = f.read()
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, num_channels, sample_rate,
+        sample_rate * num_channels * sample_width,
+        num_channels * sample_width, sample_width * 8,
+        b'data', data_size
+    )
 
-    # Clean up temp file
-    if os.path.exists(temp_file):
-        os.remove(temp_file)
 
-    return wav_file_data
+def write_wav(path, pcm_data, sample_rate, num_channels=1, sample_width=2):
+    """
+    Write raw PCM audio data to a WAV file.
 
+    The 44-byte RIFF header is packed directly and written ahead of the PCM
+    data with unbuffered os.write calls, so the audio is never copied into an
+    intermediate WAV or file-object buffer. The file is written under a
+    temporary name and renamed into place, so an interrupted run never leaves
+    a truncated WAV that later runs would skip.
 
+    Args:
+        path (str): The path of the WAV file to write.
+        pcm_data (bytes): The raw PCM audio data (signed 16-bit).
+        sample_rate (int): The sample rate of the audio (e.g., 24000).
+        num_channels (int): The number of audio channels (e.g., 1 for mono).
+        sample_width (int): The width of each audio sample in bytes (e.g., 2 for 16-bit).
+    """
+    header = wav_header(len(pcm_data), sample_rate, num_channels, sample_width)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    # O_BINARY keeps Windows from translating b'\n' to b'\r\n' in the audio
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o666)
+        try:
+            for chunk in (header, pcm_data):
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Clean up the partial temp file
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@lru_cache(maxsize=16)
 def generate_silence_pcm(duration_ms, sample_rate, num_channels=1, sample_width=2):
     """
     Generate silence (zeros) PCM data.
 
+    Results are memoized: the same few pause lengths are requested for every
+    word, and the returned bytes are immutable so they can be shared safely.
+
     Args:
         duration_ms (int): Duration of silence in milliseconds.
         sample_rate (int): Sample rate (e.g., 24000).
@@ -87,7 +260,7 @@ def generate_silence_pcm(duration_ms, sample_rate, num_channels=1, sample_width=
     """
     num_samples = int(sample_rate * duration_ms / 1000)
     num_bytes = num_samples * num_channels * sample_width
-    return b'\x00' * num_bytes
+    return bytes(num_bytes)
 
 
 def trim_audio_beginning(pcm_data, trim_ms, sample_rate, num_channels=1, sample_width=2):
@@ -102,7 +275,7 @@ def trim_audio_beginning(pcm_data, trim_ms, sample_rate, num_channels=1, sample_
         sample_width (int): Sample width in bytes (2 for 16-bit).
 
     Returns:
-        bytes: Trimmed PCM data.
+        memoryview: Trimmed PCM data, a zero-copy view into pcm_data.
     """
     # Calculate number of bytes to trim
     trim_samples = int(sample_rate * trim_ms / 1000)
@@ -111,8 +284,35 @@ def trim_audio_beginning(pcm_data, trim_ms, sample_rate, num_channels=1, sample_
     # Don't trim more than available
     trim_bytes = min(trim_bytes, len(pcm_data))
 
-    # Return trimmed data
-    return pcm_data[trim_bytes:]
+    # Return trimmed data without copying it; it is copied once when the
+    # audio is assembled or written
+    return memoryview(pcm_data)[trim_bytes:]
+
+
+# Fields of the inline audio part in a Gemini response body. Base64 never
+# needs JSON escaping, so the audio can be matched without parsing the JSON.
+_INLINE_DATA_RE = re.compile(rb'"data"\s*:\s*"([A-Za-z0-9+/=]+)"')
+_MIME_TYPE_RE = re.compile(rb'"mimeType"\s*:\s*"([^"\\]+)"')
+
+
+def extract_inline_audio(content):
+    """
+    Extract the base64 audio and its MIME type from a raw Gemini response body.
+
+    Avoids building the full JSON object (safety ratings, usage metadata, etc.)
+    just to read one nested field.
+
+    Args:
+        content (bytes): The raw response body.
+
+    Returns:
+        tuple: (audio_data_base64, mime_type) as (bytes, str) if found, (None, None) otherwise.
+    """
+    data_match = _INLINE_DATA_RE.search(content)
+    mime_match = _MIME_TYPE_RE.search(content)
+    if data_match is None or mime_match is None:
+        return None, None
+    return data_match.group(1), mime_match.group(1).decode('ascii')
 
 
 def generate_audio_pcm(text, language='es-US', retries=5, backoff_factor=1, verbose=False):
@@ -130,58 +330,42 @@ def generate_audio_pcm(text, language='es-US', retries=5, backoff_factor=1, verb
     Returns:
         tuple: (pcm_data, sample_rate) if successful, (None, None) otherwise.
     """
-    global _rate_limit_delay
-
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-tts:generateContent?key={API_KEY}"
+    global _rate_limited_until
 
-    # Generate language-specific prompt
-    if language.startswith('en'):
-        prompt = f'Say this in US English: "{text}"'
-    elif language.startswith('es'):
-        prompt = f'Say this in US Spanish: "{text}"'
-    else:
-        # Default to just the text without language instruction
-        prompt = text
-
-    payload = {
-        "contents": [{"parts": [{"text": prompt}]}],
-        "generationConfig": {
-            "responseModalities": ["AUDIO"],
-            "speechConfig": {
-                "voiceConfig": {
-                    "prebuiltVoiceConfig": {
-                        "voiceName": "Leda"
-                    }
-                }
-            }
-        },
-        "model": "gemini-2.5-flash-preview-tts"
-    }
+    # Generate language-specific prompt (default to just the text without
+    # language instruction)
+    prompt_template = _PROMPT_TEMPLATES.get(language[:2])
+    prompt = prompt_template.format(text) if prompt_template else text
 
-    # Apply persistent rate limit delay before making request
-    if _rate_limit_delay > 0:
-        time.sleep(_rate_limit_delay)
+    payload = {**_PAYLOAD_TEMPLATE, "contents": [{"parts": [{"text": prompt}]}]}
 
     for i in range(retries):
         try:
-            response = requests.post(url, headers={'Content-Type': 'application/json'}, data=json.dumps(payload))
+            # Wait out any rate-limit pause triggered by another request
+            pause = _rate_limited_until - time.monotonic()
+            if pause > 0:
+                time.sleep(pause)
+
+            _rate_limiter.acquire()
+            with _request_slots:
+                response = SESSION.post(TTS_URL, json=payload, timeout=30)
 
             # Handle 429 rate limit errors with longer backoff
             if response.status_code == 429:
-                retry_after = response.headers.get('Retry-After')
-                if retry_after:
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
                     delay = int(retry_after)
-                    print(f"⚠ Rate limit hit for '{text}'. Setting persistent delay to {delay}s (from Retry-After header)...")
+                    print(f"⚠ Rate limit hit for '{text}'. Pausing all requests for {delay}s (from Retry-After header)...")
                 else:
-                    # Use exponential backoff with minimum 2 seconds for rate limits
-                    delay = max(2, backoff_factor * (2 ** i))
-                    print(f"⚠ Rate limit hit for '{text}'. Setting persistent delay to {delay}s...")
+                    # Use jittered exponential backoff with minimum 2 seconds for rate limits
+                    delay = max(2, random.uniform(0, backoff_factor * (2 ** i)))
+                    print(f"⚠ Rate limit hit for '{text}'. Pausing all requests for {delay:.1f}s...")
 
-                # Update global rate limit delay to persist across requests
-                _rate_limit_delay = delay
+                # Hold off every thread, not just this one, until the pause ends
+                with _rate_limited_lock:
+                    _rate_limited_until = max(_rate_limited_until, time.monotonic() + delay)
 
                 if i < retries - 1:
-                    time.sleep(delay)
                     continue
                 else:
                     print(f"✗ Maximum retries reached for '{text}' due to rate limiting. Skipping.")
@@ -189,19 +373,23 @@ def generate_audio_pcm(text, language='es-US', retries=5, backoff_factor=1, verb
 
             response.raise_for_status()
 
-            result = response.json()
-            part = result.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0]
-            audio_data_base64 = part.get('inlineData', {}).get('data')
-            mime_type = part.get('inlineData', {}).get('mimeType')
+            # Fast path: pull the audio straight out of the body; fall back to
+            # a full parse for anything unexpected
+            audio_data_base64, mime_type = extract_inline_audio(response.content)
+            if audio_data_base64 is None:
+                result = response.json()
+                part = result.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0]
+                audio_data_base64 = part.get('inlineData', {}).get('data')
+                mime_type = part.get('inlineData', {}).get('mimeType')
 
             if audio_data_base64 and mime_type and mime_type.startswith("audio/"):
                 sample_rate = int(mime_type.split('rate=')[1])
-                pcm_data = base64.b64decode(audio_data_base64)
+                pcm_data = binascii.a2b_base64(audio_data_base64)
                 return pcm_data, sample_rate
             else:
                 print(f"✗ Error: No audio data found in response for '{text}'.")
                 if verbose:
-                    print(f"   Full response: {json.dumps(result, indent=2)}")
+                    print(f"   Full response: {json.dumps(response.json(), indent=2)}")
                 return None, None
 
         except requests.exceptions.HTTPError as e:
@@ -214,7 +402,7 @@ def generate_audio_pcm(text, language='es-US', retries=5, backoff_factor=1, verb
                 except:
                     print(f"   Response text: {response.text}")
             if i < retries - 1:
-                time.sleep(backoff_factor * (2 ** i))
+                time.sleep(random.uniform(0, backoff_factor * (2 ** i)))
             else:
                 print(f"✗ Maximum retries reached for '{text}'. Falling back to Google Cloud TTS...")
                 return None, None
@@ -228,7 +416,7 @@ def generate_audio_pcm(text, language='es-US', retries=5, backoff_factor=1, verb
                 except:
                     print(f"   Response text: {e.response.text}")
             if i < retries - 1:
-                time.sleep(backoff_factor * (2 ** i))
+                time.sleep(random.uniform(0, backoff_factor * (2 ** i)))
             else:
                 print(f"✗ Maximum retries reached for '{text}'. Falling back to Google Cloud TTS...")
                 return None, None
@@ -236,6 +424,30 @@ def generate_audio_pcm(text, language='es-US', retries=5, backoff_factor=1, verb
     return None, None
 
 
+# Google Cloud TTS client, created on first use and shared by all threads
+_gcloud_tts_client = None
+_gcloud_tts_client_lock = threading.Lock()
+
+
+def get_google_cloud_tts_client():
+    """
+    Get the shared Google Cloud TTS client, creating it on first use.
+
+    Creating a client loads credentials and opens a gRPC channel, so it is done
+    once instead of on every fallback call.
+
+    Returns:
+        texttospeech.TextToSpeechClient: The shared client.
+    """
+    global _gcloud_tts_client
+
+    if _gcloud_tts_client is None:
+        with _gcloud_tts_client_lock:
+            if _gcloud_tts_client is None:
+                _gcloud_tts_client = texttospeech.TextToSpeechClient()
+    return _gcloud_tts_client
+
+
 def generate_audio_google_cloud_tts(text, lang='es', voice_type='neural2'):
     """
     Generates audio using Google Cloud Text-to-Speech API as a fallback.
@@ -249,8 +461,8 @@ def generate_audio_google_cloud_tts(text, lang='es', voice_type='neural2'):
         tuple: (audio_data, sample_rate) if successful, (None, None) otherwise.
     """
     try:
-        # Initialize the Google Cloud TTS client
-        client = texttospeech.TextToSpeechClient()
+        # Get the shared Google Cloud TTS client
+        client = get_google_cloud_tts_client()
 
         # Use SSML with 300ms silence, then we'll trim 200ms to remove click artifacts
         ssml_text = f"<speak><break time='300ms'/>{text}</speak>"
@@ -298,6 +510,13 @@ def generate_audio_google_cloud_tts(text, lang='es', voice_type='neural2'):
         return None, None
 
 
+# Header words that identify a column's language
+_ENGLISH_HEADER_WORDS = frozenset(('english', 'inglés', 'ingles', 'translation', 'translations',
+                                   'meaning', 'meanings'))
+_SPANISH_HEADER_WORDS = frozenset(('spanish', 'español', 'espanol', 'palabra', 'palabras',
+                                   'word', 'words'))
+
+
 def detect_language_from_header(header):
     """
     Detect language from column header name.
@@ -310,19 +529,131 @@ def detect_language_from_header(header):
     """
     header_lower = str(header).lower()
 
+    # Split into words; underscores and digits separate words too
+    header_words = set(re.findall(r'[^\W\d_]+', header_lower))
+
     # Check for English indicators
-    if any(word in header_lower for word in ['english', 'inglés', 'ingles', 'translation', 'meaning']):
+    if header_words & _ENGLISH_HEADER_WORDS:
         return 'en'
 
-    # Check for Spanish indicators (or default to Spanish)
-    if any(word in header_lower for word in ['spanish', 'español', 'espanol', 'palabra', 'word']):
+    # Check for Spanish indicators
+    if header_words & _SPANISH_HEADER_WORDS:
+        return 'es'
+
+    # Fall back to substring matching for run-together headers (e.g. "EnglishWord")
+    if any(word in header_lower for word in _ENGLISH_HEADER_WORDS):
+        return 'en'
+    if any(word in header_lower for word in _SPANISH_HEADER_WORDS):
         return 'es'
 
     # Default to Spanish for ambiguous cases
     return 'es'
 
 
-def generate_and_save_audio(text, output_filename, lang='es', voice_type='neural2', pause_duration_ms=500, retries=5, backoff_factor=1, quiet=False, verbose=False):
+def _cache_path(text, lang):
+    """
+    Get the content-addressed cache path for a piece of text.
+
+    Only Gemini TTS audio is cached, so the key covers the Gemini model and
+    voice but not the Google Cloud TTS fallback voice.
+
+    Args:
+        text (str): The text to be converted to speech.
+        lang (str): Language code ('es' for Spanish, 'en' for English).
+
+    Returns:
+        Path: Path of the cached WAV file (may not exist yet).
+    """
+    key = f"{TTS_MODEL}\0{TTS_VOICE}\0{lang}\0{text.strip().lower()}"
+    return CACHE_DIR / (hashlib.sha256(key.encode('utf-8')).hexdigest() + '.wav')
+
+
+def _link_or_copy(src, dst):
+    """
+    Hard-link src to dst, falling back to a copy (e.g. across filesystems).
+
+    Args:
+        src (Path): Existing source file.
+        dst (str): Destination path.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        tmp_path = f"{dst}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+
+
+def save_audio(pcm_data, sample_rate, output_filename, cache_path):
+    """
+    Save PCM audio as a WAV file in the cache and link it to the output path.
+
+    Args:
+        pcm_data (bytes): The raw PCM audio data.
+        sample_rate (int): Sample rate (e.g., 24000).
+        output_filename (str): The full path to the output WAV file.
+        cache_path (Path): Cache path returned by _cache_path(), or None to
+                           write the output file without caching it.
+    """
+    if cache_path is None:
+        write_wav(output_filename, pcm_data, sample_rate)
+        return
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    write_wav(cache_path, pcm_data, sample_rate)
+
+    _link_or_copy(cache_path, output_filename)
+
+
+class WavWriter:
+    """
+    Background thread that saves generated audio to disk.
+
+    Worker threads hand finished audio to the writer and move straight on to
+    their next API request instead of waiting on file I/O. Use as a context
+    manager; leaving the block waits for all queued writes to finish.
+    """
+
+    _STOP = object()
+
+    def __init__(self, max_pending=64):
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.failures = []
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.queue.put(self._STOP)
+        self.thread.join()
+
+    def submit(self, pcm_data, sample_rate, output_filename, cache_path):
+        """
+        Queue audio to be saved with save_audio().
+
+        Args:
+            pcm_data (bytes): The raw PCM audio data.
+            sample_rate (int): Sample rate (e.g., 24000).
+            output_filename (str): The full path to the output WAV file.
+            cache_path (Path): Cache path returned by _cache_path(), or None.
+        """
+        self.queue.put((pcm_data, sample_rate, output_filename, cache_path))
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is self._STOP:
+                return
+            try:
+                save_audio(*item)
+            except Exception as e:
+                print(f"✗ Failed to save '{item[2]}': {e}")
+                self.failures.append(item[2])
+
+
+def generate_and_save_audio(text, output_filename, lang='es', voice_type='neural2', pause_duration_ms=500, retries=5, backoff_factor=1, quiet=False, verbose=False, writer=None, existing=None, refresh=False):
     """
     Generates audio from text using the Gemini TTS API with Google Cloud TTS as fallback.
     Saves the result as a WAV file. Handles "/" separator by generating audio for each part with pauses in between.
@@ -338,12 +669,32 @@ def generate_and_save_audio(text, output_filename, lang='es', voice_type='neural
         backoff_factor (int): The backoff factor for exponential retry delay.
         quiet (bool): If True, suppress informational messages.
         verbose (bool): If True, print detailed error messages.
+        writer (WavWriter): If given, hand the audio to this writer instead of saving it inline.
+        existing (set): If given, filenames already in the output directory; checked
+                        instead of stat()-ing the output path, and updated on success.
+        refresh (bool): If True, ignore cached audio and request it again;
+                        the cache is updated with the new audio.
 
     Returns:
         bool: True if successful, False otherwise.
     """
+    save = writer.submit if writer is not None else save_audio
+
     # Check if the file already exists to avoid redundant API calls
-    if os.path.exists(output_filename):
+    basename = os.path.basename(output_filename)
+    if existing is not None:
+        already_exists = basename in existing
+    else:
+        already_exists = os.path.exists(output_filename)
+    if already_exists:
+        return True
+
+    # Reuse audio generated earlier for the same text (e.g. from another CSV)
+    cache_path = _cache_path(text, lang)
+    if not refresh and cache_path.exists():
+        _link_or_copy(cache_path, output_filename)
+        if existing is not None:
+            existing.add(basename)
         return True
 
     # Check if text contains "/" separator
@@ -356,23 +707,33 @@ def generate_and_save_audio(text, output_filename, lang='es', voice_type='neural
                 print(f"✗ Error: No valid text parts found in '{text}'.")
             return False
 
-        # Generate audio for each part
-        combined_pcm = b''
-        sample_rate = None
-
-        for idx, part in enumerate(parts):
-            # Convert language code to full format (es -> es-US, en -> en-US)
-            language_code = f"{lang}-US"
+        # Convert language code to full format (es -> es-US, en -> en-US)
+        language_code = f"{lang}-US"
 
+        def generate_part(part):
             # Try Gemini first
             pcm_data, rate = generate_audio_pcm(part, language_code, retries, backoff_factor, verbose)
 
             # If Gemini fails, try Google Cloud TTS
-            if pcm_data is None:
+            used_fallback = pcm_data is None
+            if used_fallback:
                 if not quiet:
                     print(f"⚠ Trying Google Cloud TTS for part '{part}'...")
                 pcm_data, rate = generate_audio_google_cloud_tts(part, lang, voice_type)
 
+            return pcm_data, rate, used_fallback
+
+        # Request all parts in parallel so an N-part phrase costs one round-trip
+        # instead of N; results come back in order for stitching
+        with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+            results = list(executor.map(generate_part, parts))
+
+        # Collect the audio for each part; joined once at the end to avoid
+        # re-copying the accumulated buffer on every append
+        chunks = []
+        sample_rate = None
+
+        for idx, (part, (pcm_data, rate, _)) in enumerate(zip(parts, results)):
             if pcm_data is None:
                 if not quiet:
                     print(f"✗ Failed to generate audio for part '{part}' using both APIs.")
@@ -386,21 +747,26 @@ def generate_and_save_audio(text, output_filename, lang='es', voice_type='neural
                 return False
 
             # Add PCM data
-            combined_pcm += pcm_data
+            chunks.append(pcm_data)
 
             # Add pause between parts (but not after the last part)
             if idx < len(parts) - 1:
                 silence = generate_silence_pcm(pause_duration_ms, sample_rate)
-                combined_pcm += silence
+                chunks.append(silence)
 
         # Add leading silence to prevent click (100ms)
         leading_silence = generate_silence_pcm(100, sample_rate)
-        combined_pcm = leading_silence + combined_pcm
+        combined_pcm = b''.join([leading_silence, *chunks])
+
+        # Only cache Gemini audio, so a rerun after an outage can replace
+        # fallback audio by deleting the WAV file
+        if any(used_fallback for _, _, used_fallback in results):
+            cache_path = None
 
         # Convert combined PCM to WAV and save
-        wav_data = pcm_to_wav(combined_pcm, sample_rate)
-        with open(output_filename, 'wb') as f:
-            f.write(wav_data)
+        save(combined_pcm, sample_rate, output_filename, cache_path)
+        if existing is not None:
+            existing.add(basename)
 
         return True
 
@@ -412,11 +778,12 @@ def generate_and_save_audio(text, output_filename, lang='es', voice_type='neural
         # Try Gemini first
         pcm_data, sample_rate = generate_audio_pcm(text, language_code, retries, backoff_factor, verbose)
 
-        # If Gemini fails, try Google Cloud TTS
+        # If Gemini fails, try Google Cloud TTS (not cached, see above)
         if pcm_data is None:
             if not quiet:
                 print(f"⚠ Trying Google Cloud TTS for '{text}'...")
             pcm_data, sample_rate = generate_audio_google_cloud_tts(text, lang, voice_type)
+            cache_path = None
 
         if pcm_data is None:
             if not quiet:
@@ -428,17 +795,38 @@ def generate_and_save_audio(text, output_filename, lang='es', voice_type='neural
         pcm_data = leading_silence + pcm_data
 
         # Convert PCM to WAV and save to a file
-        wav_data = pcm_to_wav(pcm_data, sample_rate)
-        with open(output_filename, 'wb') as f:
-            f.write(wav_data)
+        save(pcm_data, sample_rate, output_filename, cache_path)
+        if existing is not None:
+            existing.add(basename)
 
         return True
 
 
+class _FilenameTable(dict):
+    """
+    str.translate() table for sanitize_filename.
+
+    Maps spaces and forward slashes to underscores, keeps alphanumerics and
+    '_', '-', '.', and deletes everything else. Entries are computed on first
+    use and remembered, so translation runs in C for characters seen before.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = char if char.isalnum() or char in ('_', '-', '.') else None
+        self[codepoint] = value
+        return value
+
+
+_FILENAME_TABLE = _FilenameTable({ord(' '): '_', ord('/'): '_'})
+
+
+@lru_cache(maxsize=None)
 def sanitize_filename(text):
     """
     Sanitize text to create a valid filename.
     Replaces spaces with underscores and removes problematic characters.
+    Results are memoized, since the same words recur across CSV files.
 
     Args:
         text (str): The text to sanitize.
@@ -446,23 +834,20 @@ def sanitize_filename(text):
     Returns:
         str: Sanitized filename (without extension).
     """
-    # Replace spaces with underscores
-    filename = text.replace(' ', '_')
-    # Replace forward slashes with underscores
-    filename = filename.replace('/', '_')
-    # Remove other problematic characters
-    filename = ''.join(c for c in filename if c.isalnum() or c in ('_', '-', '.'))
-    return filename
+    return text.translate(_FILENAME_TABLE)
 
 
-def process_csv(csv_path, verbose=False):
+def process_csv(csv_path, concurrency=8, verbose=False, refresh=False):
     """
     Process a CSV file and generate audio for all unique words.
     Detects language based on column headers.
 
     Args:
         csv_path (str): Path to the CSV file.
+        concurrency (int): Maximum number of words synthesized in parallel.
         verbose (bool): If True, print detailed error messages.
+        refresh (bool): If True, request missing audio again instead of
+                        reusing it from the audio cache.
 
     Returns:
         tuple: (success_count, total_count)
@@ -474,6 +859,8 @@ def process_csv(csv_path, verbose=False):
         print(f"✗ Error: File '{csv_path}' not found.")
         return 0, 0
 
+    configure_concurrency(concurrency)
+
     # Create output directory based on CSV filename (without .csv extension)
     output_dir = csv_path.parent / csv_path.stem
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -482,13 +869,15 @@ def process_csv(csv_path, verbose=False):
     print(f"📂 Output directory: {output_dir}\n")
 
     try:
-        # Read CSV file
-        df = pd.read_csv(csv_path)
-
-        if df.shape[1] < 2:
-            print(f"✗ Error: CSV must have at least 2 columns. Found {df.shape[1]}.")
+        # Check the header first, then read only the two word columns as
+        # plain strings (empty cells become '' rather than NaN)
+        num_columns = pd.read_csv(csv_path, nrows=0).shape[1]
+        if num_columns < 2:
+            print(f"✗ Error: CSV must have at least 2 columns. Found {num_columns}.")
             return 0, 0
 
+        df = pd.read_csv(csv_path, usecols=[0, 1], dtype=str, keep_default_na=False)
+
         # Detect language for each column based on header
         first_col = df.columns[0]
         second_col = df.columns[1]
@@ -499,40 +888,126 @@ def process_csv(csv_path, verbose=False):
         print(f"   • {first_col}: {first_col_lang.upper()}")
         print(f"   • {second_col}: {second_col_lang.upper()}\n")
 
-        # Build word->language mapping
-        word_lang_map = {}
-
-        # Process first column
-        for word in df[first_col].dropna().unique():
-            word_lang_map[str(word).strip()] = first_col_lang
-
-        # Process second column
-        for word in df[second_col].dropna().unique():
-            word_lang_map[str(word).strip()] = second_col_lang
+        # Collect each column's unique words, stripping and de-duplicating
+        # with vectorized pandas operations
+        column_words = []
+        for col in (first_col, second_col):
+            col_words = df[col].str.strip()
+            column_words.append(pd.unique(col_words[col_words != ''].to_numpy()))
+
+        # Build word->language mapping. The app looks audio up by word alone,
+        # so a word in both columns gets a single file; use the first column's
+        # language for it rather than letting the second column silently win.
+        word_lang_map = dict.fromkeys(column_words[1], second_col_lang)
+        word_lang_map.update(dict.fromkeys(column_words[0], first_col_lang))
+
+        if first_col_lang != second_col_lang:
+            shared_words = sorted(set(column_words[0]).intersection(column_words[1]))
+            if shared_words:
+                print(f"⚠ {len(shared_words)} word(s) appear in both columns; generating {first_col_lang.upper()} "
+                      f"audio for: {', '.join(shared_words)}\n")
 
         words = sorted(word_lang_map.keys())  # Sort for consistent ordering
         total_count = len(words)
 
-        # Generate audio for each word with progress bar
-        success_count = 0
-        with tqdm(total=total_count, desc="Generating audio", unit="file",
-                  bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]') as pbar:
-            for word in words:
-                word_str = str(word).strip()
-                if not word_str:
-                    continue
-
-                filename = sanitize_filename(word_str) + '.wav'
-                output_path = output_dir / filename
-                lang = word_lang_map.get(word_str, 'es')
-
-                # Update progress bar description with current word
-                pbar.set_postfix_str(f"'{word_str}' ({lang.upper()}) -> {filename}", refresh=True)
+        # Read the output directory once and only queue words without a WAV
+        # file yet, rather than stat()-ing every output path
+        existing = {entry.name for entry in os.scandir(output_dir)}
+
+        def has_audio(filename):
+            # A name missing from the snapshot may still exist on a
+            # case-insensitive filesystem (e.g. macOS), so confirm with stat()
+            if filename in existing:
+                return True
+            if (output_dir / filename).exists():
+                existing.add(filename)
+                return True
+            return False
 
-                if generate_and_save_audio(word_str, str(output_path), lang=lang, quiet=True, verbose=verbose):
-                    success_count += 1
+        # Words that differ only in case are pronounced the same, so group
+        # them and synthesize each group once; the other spellings' files are
+        # linked to the first one afterwards
+        groups = {}
+        for word in words:
+            word_str = str(word).strip()
+            if not word_str:
+                continue
+
+            lang = word_lang_map.get(word_str, 'es')
+            filename = sanitize_filename(word_str) + '.wav'
+            groups.setdefault((word_str.casefold(), lang), {}).setdefault(filename, (word_str, lang, filename))
+
+        pending = []  # (word, lang, filename) to synthesize
+        aliases = []  # (source filename, alias filename) to link afterwards
+        for group in groups.values():
+            group = list(group.values())
+            present = []
+            missing = []
+            for entry in group:
+                # Check each file once; a miss costs a stat() (see has_audio)
+                if has_audio(entry[2]):
+                    present.append(entry)
+                else:
+                    missing.append(entry)
+            if not missing:
+                continue
 
-                pbar.update(1)
+            if present:
+                source = present[0][2]
+            else:
+                pending.append(missing[0])
+                source = missing[0][2]
+                missing = missing[1:]
+            aliases.extend((source, entry[2]) for entry in missing)
+
+        success_count = total_count - len(pending) - len(aliases)
+        if success_count:
+            print(f"⏭ Skipping {success_count} word(s) that already have audio\n")
+
+        # Generate audio for each pending word with progress bar.
+        # The work is network-bound (requests releases the GIL while waiting on
+        # the socket), so a thread pool overlaps the API round-trips while a
+        # single writer thread takes file I/O off the workers.
+        with tqdm(total=len(pending), desc="Generating audio", unit="file", mininterval=0.2, miniters=1,
+                  bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]') as pbar, \
+                WavWriter() as writer, \
+                ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {}
+            for word_str, lang, filename in pending:
+                output_path = output_dir / filename
+                future = executor.submit(generate_and_save_audio, word_str, str(output_path),
+                                         lang=lang, quiet=True, verbose=verbose, writer=writer,
+                                         existing=existing, refresh=refresh)
+                futures[future] = (word_str, lang, filename)
+
+            try:
+                for future in as_completed(futures):
+                    word_str, lang, filename = futures[future]
+
+                    # Update progress bar description with the word that just finished;
+                    # the bar itself redraws at most every mininterval
+                    pbar.set_postfix_str(f"'{word_str}' ({lang.upper()}) -> {filename}", refresh=False)
+
+                    if future.result():
+                        success_count += 1
+
+                    pbar.update(1)
+            except BaseException:
+                # Drop queued words on Ctrl-C or an error instead of letting
+                # the executor's exit run every one of them first
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        success_count -= len(writer.failures)
+
+        # Link duplicate spellings to the audio generated for their group
+        for source, alias in aliases:
+            if (output_dir / alias).exists():
+                # Same file as the source on a case-insensitive filesystem
+                success_count += 1
+            elif (output_dir / source).exists():
+                _link_or_copy(output_dir / source, output_dir / alias)
+                success_count += 1
 
         print(f"\n{'='*60}")
         print(f"✓ Complete: {success_count}/{total_count} files generated successfully")
@@ -546,6 +1021,45 @@ def process_csv(csv_path, verbose=False):
         return 0, 0
 
 
+def process_directory(data_dir, concurrency=8, verbose=False, refresh=False):
+    """
+    Process every CSV file in a directory and generate audio for all of them.
+    Words shared between CSV files are synthesized once; later files get them
+    from the audio cache without another API call.
+
+    Args:
+        data_dir (str): Path to the directory containing CSV files.
+        concurrency (int): Maximum number of words synthesized in parallel.
+        verbose (bool): If True, print detailed error messages.
+        refresh (bool): If True, request missing audio again instead of
+                        reusing it from the audio cache.
+
+    Returns:
+        tuple: (success_count, total_count) summed over all CSV files
+    """
+    data_dir = Path(data_dir)
+
+    if not data_dir.is_dir():
+        print(f"✗ Error: Directory '{data_dir}' not found.")
+        return 0, 0
+
+    csv_files = sorted(data_dir.glob('*.csv'))
+    if not csv_files:
+        print(f"✗ Error: No CSV files found in '{data_dir}'.")
+        return 0, 0
+
+    success_count = 0
+    total_count = 0
+    for csv_file in csv_files:
+        success, total = process_csv(csv_file, concurrency=concurrency, verbose=verbose, refresh=refresh)
+        success_count += success
+        total_count += total
+
+    print(f"✓ Batch complete: {success_count}/{total_count} files across {len(csv_files)} CSV file(s)\n")
+
+    return success_count, total_count
+
+
 def test_tts(text, lang='es', api='auto', voice_type='neural2'):
     """
     Test TTS APIs by generating audio for a word/phrase and playing it.
@@ -603,9 +1117,7 @@ def test_tts(text, lang='es', api='auto', voice_type='neural2'):
         return False
 
     # Save audio file
-    wav_data = pcm_to_wav(pcm_data, sample_rate)
-    with open(output_path, 'wb') as f:
-        f.write(wav_data)
+    write_wav(output_path, pcm_data, sample_rate)
 
     print(f"✓ Audio saved to: {output_path}")
     print(f"   API used: {api_used}")
@@ -661,6 +1173,13 @@ Examples:
   # Generate audio for CSV file
   uv run tools/generate_flashcard_audio.py data/words.csv
   uv run tools/generate_flashcard_audio.py flashcards/public/data/spanish_speaking_countries_and_capitals.csv
+  uv run tools/generate_flashcard_audio.py data/words.csv --concurrency 16
+
+  # Generate audio for every CSV file in a directory
+  uv run tools/generate_flashcard_audio.py --batch flashcards/public/data
+
+  # Regenerate deleted WAV files instead of restoring them from the cache
+  uv run tools/generate_flashcard_audio.py data/words.csv --refresh
 
   # Test TTS APIs (default: Neural2 voice)
   uv run tools/generate_flashcard_audio.py --test "Hola mundo"
@@ -673,7 +1192,9 @@ Examples:
   uv run tools/generate_flashcard_audio.py --test "Hola mundo" --voice-type wavenet --api cloud
         """
     )
-    parser.add_argument('csv_file', nargs='?', help='Path to the CSV file (not used with --test)')
+    parser.add_argument('csv_file', nargs='?', help='Path to the CSV file (not used with --test or --batch)')
+    parser.add_argument('--batch', type=str, metavar='DIR',
+                       help='Batch mode: generate audio for every CSV file in DIR')
     parser.add_argument('--test', type=str, metavar='TEXT',
                        help='Test mode: generate and play audio for the given text')
     parser.add_argument('--lang', type=str, default='es', choices=['es', 'en'],
@@ -682,21 +1203,41 @@ Examples:
                        help='API to use in test mode: gemini, cloud, or auto (try gemini then cloud) (default: auto)')
     parser.add_argument('--voice-type', type=str, default='neural2', choices=['neural2', 'wavenet'],
                        help='Voice type for Google Cloud TTS: neural2 (high-quality) or wavenet (premium) (default: neural2)')
+    parser.add_argument('--concurrency', type=int, default=8,
+                       help='Number of words to synthesize in parallel (default: 8)')
+    parser.add_argument('--rpm', type=int, default=60,
+                       help='Maximum Gemini TTS requests per minute across all workers (default: 60)')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Request missing audio again instead of reusing it from the audio cache')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Show detailed error messages from API failures')
 
     args = parser.parse_args()
 
+    if args.rpm < 1:
+        parser.error('--rpm must be at least 1')
+    _rate_limiter.set_rate(args.rpm)
+
     # Test mode
     if args.test:
         success = test_tts(args.test, lang=args.lang, api=args.api, voice_type=args.voice_type)
         sys.exit(0 if success else 1)
 
     # Normal CSV processing mode
-    if not args.csv_file:
-        parser.error('csv_file is required when not using --test')
+    if args.batch and args.csv_file:
+        parser.error('csv_file cannot be combined with --batch')
+    if not args.batch and not args.csv_file:
+        parser.error('csv_file is required when not using --test or --batch')
 
-    success, total = process_csv(args.csv_file, verbose=args.verbose)
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+
+    if args.batch:
+        success, total = process_directory(args.batch, concurrency=args.concurrency, verbose=args.verbose,
+                                            refresh=args.refresh)
+    else:
+        success, total = process_csv(args.csv_file, concurrency=args.concurrency, verbose=args.verbose,
+                                      refresh=args.refresh)
 
     # Exit with appropriate status code
     sys.exit(0 if success == total else 1)
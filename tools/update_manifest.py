@@ -7,9 +7,10 @@ and generates a manifest.json file that the React app uses to
 dynamically load available flashcard sets.
 
 Usage:
-    uv run tools/update_manifest.py
+    uv run tools/update_manifest.py [--force]
 """
 
+import argparse
 import json
 import os
 from pathlib import Path
@@ -38,9 +39,17 @@ def format_name(filename):
     return name
 
 
-def update_manifest():
+def update_manifest(force=False):
     """
     Scan the data folder for CSV files and update manifest.json.
+
+    The manifest only lists file names, so it can only go stale when a file
+    is added, removed or renamed, all of which update the data folder's
+    modification time. If manifest.json is newer than the folder, nothing
+    is rescanned or rewritten.
+
+    Args:
+        force (bool): If True, regenerate the manifest even if it looks up to date.
     """
     # Get the project root directory (parent of tools/)
     project_root = Path(__file__).parent.parent
@@ -51,20 +60,21 @@ def update_manifest():
         print(f"Error: Data directory not found: {data_dir}")
         return
 
-    # Find all CSV files
-    csv_files = sorted(data_dir.glob('*.csv'))
+    if not force and manifest_path.exists() and \
+            manifest_path.stat().st_mtime >= data_dir.stat().st_mtime:
+        print(f"✓ {manifest_path} is up to date (use --force to regenerate)")
+        return
+
+    # Find all CSV files in a single directory pass
+    csv_files = sorted(entry.name for entry in os.scandir(data_dir)
+                       if entry.name.endswith('.csv') and entry.is_file())
 
     if not csv_files:
         print(f"Warning: No CSV files found in {data_dir}")
         return
 
     # Build manifest entries
-    manifest = []
-    for csv_file in csv_files:
-        manifest.append({
-            'name': format_name(csv_file.name),
-            'file': csv_file.name
-        })
+    manifest = [{'name': format_name(name), 'file': name} for name in csv_files]
 
     # Write manifest.json
     with open(manifest_path, 'w', encoding='utf-8') as f:
@@ -78,4 +88,9 @@ def update_manifest():
 
 
 if __name__ == '__main__':
-    update_manifest()
+    parser = argparse.ArgumentParser(description='Update manifest.json with all CSV files in the data folder.')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate the manifest even if no CSV files were added, removed or renamed')
+    args = parser.parse_args()
+
+    update_manifest(force=args.force)